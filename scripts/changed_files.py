@@ -4,36 +4,40 @@ Detect changed files and categorize them by type for selective CI/CD checks.
 """
 
 import json
+import os
+import re
 import subprocess
 import sys
-from pathlib import Path
 from typing import Dict, List, Set
 
+# Top-level directories that give YAML files their own category
+_DIR_RE = re.compile(r"(?:^|/)(playbooks|roles|stacks|molecule)/")
 
-def run_command(cmd: List[str]) -> str:
-    """Run a shell command and return output."""
+
+def run_command(cmd: List[str]) -> bytes:
+    """Run a shell command and return raw output bytes."""
     try:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             check=True,
         )
-        return result.stdout.strip()
+        return result.stdout
     except subprocess.CalledProcessError as e:
         print(f"Error running command: {' '.join(cmd)}", file=sys.stderr)
-        print(f"Error: {e.stderr}", file=sys.stderr)
-        return ""
+        print(f"Error: {e.stderr.decode(errors='replace')}", file=sys.stderr)
+        return b""
 
 
 def get_changed_files(base_ref: str = "origin/main") -> List[str]:
     """Get list of changed files compared to base ref."""
-    # Try to get changed files from git
-    output = run_command(["git", "diff", "--name-only", base_ref])
+    # NUL-terminated output is unambiguous (filenames may contain newlines)
+    # and lets us skip a full text-decode pass over large diffs
+    output = run_command(["git", "diff", "-z", "--name-only", base_ref])
     if not output:
         # If no changes or not in git repo, return empty list
         return []
-    return [f for f in output.split("\n") if f]
+    return [os.fsdecode(f) for f in output.split(b"\x00") if f]
 
 
 def categorize_files(files: List[str]) -> Dict[str, List[str]]:
@@ -52,32 +56,30 @@ def categorize_files(files: List[str]) -> Dict[str, List[str]]:
     }
 
     for file in files:
-        path = Path(file)
+        # Cheap string slicing instead of constructing a Path per file
+        name = file.rpartition("/")[2]
+        stem, dot, last = name.rpartition(".")
+        ext = "." + last if dot and stem else ""
 
         # Check by extension
-        if path.suffix in [".yml", ".yaml"]:
+        if ext in (".yml", ".yaml"):
             categories["yaml"].append(file)
 
-            # Check by directory
-            if "playbooks/" in file:
-                categories["playbooks"].append(file)
-            elif "roles/" in file:
-                categories["roles"].append(file)
-            elif "stacks/" in file:
-                categories["stacks"].append(file)
-            elif "molecule/" in file:
-                categories["molecule"].append(file)
-
-        elif path.suffix == ".py":
+            # Check by directory (single scan instead of one per bucket)
+            match = _DIR_RE.search(file)
+            if match:
+                categories[match.group(1)].append(file)
+
+        elif ext == ".py":
             categories["python"].append(file)
 
-        elif path.suffix == ".sh":
+        elif ext == ".sh":
             categories["shell"].append(file)
 
-        elif "Dockerfile" in path.name or path.name == "Containerfile":
+        elif "Dockerfile" in name or name == "Containerfile":
             categories["dockerfile"].append(file)
 
-        elif path.suffix in [".md", ".rst", ".txt"]:
+        elif ext in (".md", ".rst", ".txt"):
             categories["docs"].append(file)
 
         else:
@@ -86,24 +88,28 @@ def categorize_files(files: List[str]) -> Dict[str, List[str]]:
     return categories
 
 
+# File categories that always trigger checks when changed
+_ALWAYS_RUN = frozenset({"playbooks", "roles", "molecule", "yaml"})
+
+# Pre-built trigger table: check name -> file categories that require it
+_CHECK_TRIGGERS = {
+    "lint_ansible": frozenset({"playbooks", "roles", "yaml"}),
+    "lint_yaml": frozenset({"yaml", "playbooks", "roles", "stacks", "molecule"}),
+    "lint_python": frozenset({"python"}),
+    "lint_shell": frozenset({"shell"}),
+    "lint_docker": frozenset({"dockerfile", "stacks"}),
+    "test_molecule": frozenset({"playbooks", "roles", "molecule", "yaml"}),
+}
+
+
 def should_run_check(category: str, changed_categories: Set[str]) -> bool:
     """Determine if a check should run based on changed file categories."""
     # Always run if playbooks, roles, or molecule files changed
-    always_run = {"playbooks", "roles", "molecule", "yaml"}
-    if always_run & changed_categories:
+    if _ALWAYS_RUN & changed_categories:
         return True
 
     # Run specific checks for their categories
-    check_mappings = {
-        "lint_ansible": {"playbooks", "roles", "yaml"},
-        "lint_yaml": {"yaml", "playbooks", "roles", "stacks", "molecule"},
-        "lint_python": {"python"},
-        "lint_shell": {"shell"},
-        "lint_docker": {"dockerfile", "stacks"},
-        "test_molecule": {"playbooks", "roles", "molecule", "yaml"},
-    }
-
-    return bool(check_mappings.get(category, set()) & changed_categories)
+    return bool(_CHECK_TRIGGERS.get(category, frozenset()) & changed_categories)
 
 
 def main():
@@ -4,11 +4,17 @@ from __future__ import annotations
 
 import subprocess
 import sys
+from collections import deque
 from pathlib import Path
-from typing import Dict, Iterable, Set
+from typing import Dict, Set
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 INVENTORY_FILE = PROJECT_ROOT / "inventory" / "hosts.yml"
@@ -20,14 +26,19 @@ def load_inventory_hosts(inventory_path: Path) -> Dict[str, Set[str]]:
         raise FileNotFoundError(f"Inventory file not found: {inventory_path}")
 
     with inventory_path.open(encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
+        data = yaml.load(fh, Loader=SafeLoader) or {}
 
     mapping: Dict[str, Set[str]] = {}
 
-    def walk(node: object) -> None:
+    # Iterative walk: no per-node call-frame overhead, no RecursionError
+    # on deeply nested inventories
+    stack: deque = deque([data])
+    while stack:
+        node = stack.pop()
         if isinstance(node, dict):
-            if "hosts" in node and isinstance(node["hosts"], dict):
-                for name, params in node["hosts"].items():
+            hosts = node.get("hosts")
+            if isinstance(hosts, dict):
+                for name, params in hosts.items():
                     entry_names: Set[str] = set()
                     entry_names.add(str(name))
                     if isinstance(params, dict):
@@ -44,13 +55,10 @@ def load_inventory_hosts(inventory_path: Path) -> Dict[str, Set[str]]:
                     names = mapping.setdefault(scan_target, set())
                     names.update(entry_names)
                     names.add(scan_target)
-            for child in node.values():
-                walk(child)
+            stack.extend(node.values())
         elif isinstance(node, list):
-            for item in node:
-                walk(item)
+            stack.extend(node)
 
-    walk(data)
     return mapping
 
 
@@ -74,26 +82,38 @@ def resolve_ssh_hostname(host: str) -> str:
     return host
 
 
-def ssh_keyscan(host: str) -> Iterable[str]:
-    # Resolve SSH config alias to actual hostname/IP
-    resolved_host = resolve_ssh_hostname(host)
-    
+def ssh_keyscan_all(resolved_targets: Dict[str, list[str]]) -> Dict[str, list[str]]:
+    """Scan every host with a single ssh-keyscan invocation.
+
+    ``resolved_targets`` maps resolved hostname/IP to every original scan
+    target that resolved there; scanned lines fan out to each of them.
+    ssh-keyscan connects to all hosts concurrently, so one subprocess replaces
+    N sequential fork+exec cycles and N serial SSH handshakes.
+    """
+    results: Dict[str, list[str]] = {target: [] for targets in resolved_targets.values() for target in targets}
+    if not resolved_targets:
+        return results
+
     proc = subprocess.run(
-        ["ssh-keyscan", resolved_host],
+        ["ssh-keyscan", "-T", "5", *resolved_targets],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
         check=False,
     )
 
-    if proc.returncode != 0:
-        print(f"⚠️  ssh-keyscan failed for {host} ({resolved_host}): {proc.stderr.strip()}", file=sys.stderr)
-        return []
+    if proc.returncode != 0 and not proc.stdout:
+        print(f"⚠️  ssh-keyscan failed: {proc.stderr.strip()}", file=sys.stderr)
+        return results
+
+    for line in proc.stdout.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        host_field = line.split(" ", 1)[0]
+        for target in resolved_targets.get(host_field, ()):
+            results[target].append(line)
 
-    lines = [line for line in proc.stdout.splitlines() if line and not line.startswith("#")] 
-    if not lines:
-        print(f"⚠️  No host keys discovered for {host} ({resolved_host})", file=sys.stderr)
-    return lines
+    return results
 
 
 def main() -> int:
@@ -104,20 +124,29 @@ def main() -> int:
 
     KNOWN_HOSTS_FILE.parent.mkdir(parents=True, exist_ok=True)
 
+    # Resolve SSH config aliases to actual hostnames/IPs before the batch
+    # scan; distinct targets may resolve to the same host, so keep them all
+    resolved_targets: Dict[str, list[str]] = {}
+    for target in sorted(host_map):
+        resolved_targets.setdefault(resolve_ssh_hostname(target), []).append(target)
+    print(f"Gathering SSH keys for {len(host_map)} host(s)...")
+    scanned = ssh_keyscan_all(resolved_targets)
+
     all_entries: list[str] = []
     for scan_target, names in sorted(host_map.items()):
-        print(f"Gathering SSH keys for {scan_target}...")
-        entries = list(ssh_keyscan(scan_target))
-        if entries:
-            all_entries.append(f"# {scan_target}")
-            for entry in entries:
-                try:
-                    host_field, remainder = entry.split(" ", 1)
-                except ValueError:
-                    continue
-                unique_names = {host_field, *names}
-                for name in sorted(unique_names):
-                    all_entries.append(f"{name} {remainder}")
+        entries = scanned.get(scan_target, [])
+        if not entries:
+            print(f"⚠️  No host keys discovered for {scan_target}", file=sys.stderr)
+            continue
+        all_entries.append(f"# {scan_target}")
+        for entry in entries:
+            try:
+                host_field, remainder = entry.split(" ", 1)
+            except ValueError:
+                continue
+            unique_names = {host_field, *names}
+            for name in sorted(unique_names):
+                all_entries.append(f"{name} {remainder}")
 
     if not all_entries:
         print("⚠️  No host keys collected; known_hosts not modified.", file=sys.stderr)
@@ -5,7 +5,34 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+import yaml
+
 # Ensure project root is importable for scripts/* modules
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+# libyaml-backed loader is ~10x faster than the pure-Python SafeLoader
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@pytest.fixture(scope="session")
+def yaml_documents():
+    """Parse every playbook and stack compose file once per session.
+
+    Keyed by path relative to the project root, e.g.
+    ``playbooks/docker-bootstrap.yml`` or ``stacks/traefik/docker-compose.yml``.
+    """
+    documents = {}
+    for path in ROOT.glob("playbooks/*.yml"):
+        documents[f"playbooks/{path.name}"] = yaml.load(path.read_bytes(), Loader=_LOADER)
+    for path in ROOT.glob("stacks/*/docker-compose.yml"):
+        documents[f"stacks/{path.parent.name}/docker-compose.yml"] = yaml.load(path.read_bytes(), Loader=_LOADER)
+    return documents
+
+
+@pytest.fixture(scope="session")
+def makefile_text():
+    """Read the Makefile once per session for target assertions."""
+    return (ROOT / "Makefile").read_text()
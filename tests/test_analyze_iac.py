@@ -9,10 +9,11 @@ from typing import Iterable
 
 import pytest
 
-from scripts.analyze_iac import IaCAnalyzer
+from scripts.analyze_iac import IaCAnalyzer, _write_json_report
 
 
-pytestmark = pytest.mark.unit
+# xdist_group keeps analyzer tests on one worker under pytest-xdist
+pytestmark = [pytest.mark.unit, pytest.mark.xdist_group("iac_analyzer")]
 
 
 def _write_text(path: Path, content: str) -> None:
@@ -113,6 +114,47 @@ def test_compose_security_checks_detect_privileged_and_host(tmp_path: Path) -> N
     assert any("host network mode" in issue.message for issue in analyzer.issues)
 
 
+def test_compose_prefilter_skips_smell_free_malformed_file(tmp_path: Path) -> None:
+    """A broken compose file without smell bytes is skipped, not reported.
+
+    Accepted tradeoff of the byte pre-filter: syntax validation belongs to
+    yamllint in `make check`, not this analyzer.
+    """
+    compose_path = tmp_path / "stacks" / "app" / "docker-compose.yml"
+    _write_yaml(
+        compose_path,
+        [
+            "services:",
+            "  app:",
+            "   image: [unclosed",
+        ],
+    )
+
+    analyzer = IaCAnalyzer()
+    analyzer._analyze_compose_file(compose_path)
+
+    assert analyzer.issues == []
+
+
+def test_compose_parse_error_reported_when_smells_present(tmp_path: Path) -> None:
+    """Malformed compose files that pass the pre-filter still report the parse error."""
+    compose_path = tmp_path / "stacks" / "app" / "docker-compose.yml"
+    _write_yaml(
+        compose_path,
+        [
+            "services:",
+            "  app:",
+            "    privileged: true",
+            "   image: [unclosed",
+        ],
+    )
+
+    analyzer = IaCAnalyzer()
+    analyzer._analyze_compose_file(compose_path)
+
+    assert any("YAML parsing error" in issue.message for issue in analyzer.issues)
+
+
 def test_generate_summary_counts_by_severity(tmp_path: Path) -> None:
     playbook_path = tmp_path / "playbooks" / "sample.yml"
     _write_yaml(
@@ -161,8 +203,8 @@ def test_analyzer_serializes_report_to_json(tmp_path: Path) -> None:
     report = analyzer.analyze_project(tmp_path)
 
     output = tmp_path / "report.json"
-    with open(output, "w", encoding="utf-8") as handle:
-        json.dump(report.summary, handle)
+    _write_json_report(report, output)
 
     data = json.loads(output.read_text(encoding="utf-8"))
-    assert "total_issues" in data
+    assert "total_issues" in data["summary"]
+    assert "scores" in data
@@ -3,106 +3,136 @@
 from __future__ import annotations
 
 import json
-import sys
+import os
+import shutil
 from pathlib import Path
-from typing import Iterable
 
 import pytest
 
 from scripts import analyze_iac
 
 
-pytestmark = pytest.mark.unit
-
-
-def _write_yaml(path: Path, lines: Iterable[str]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
+# xdist_group keeps analyzer tests (and their module-scoped projects) on one worker
+pytestmark = [pytest.mark.unit, pytest.mark.xdist_group("iac_analyzer")]
+
+
+def _bulk_write(root: Path, files: "dict[str, bytes]") -> None:
+    """Write files relative to root, creating each unique parent only once."""
+    for parent in {Path(rel).parent for rel in files}:
+        (root / parent).mkdir(parents=True, exist_ok=True)
+    for rel, payload in files.items():
+        (root / rel).write_bytes(payload)
+
+
+# Fixture payloads encoded once at import; every project build reuses the blobs
+_DIRTY_PLAYBOOK = b"""\
+- name: Deploy Traefik stack
+  hosts: traefik
+  tasks:
+    - name: Pull Traefik image
+      community.docker.docker_image:
+        name: traefik:v3.2
+    - name: Insecure Docker access
+      shell: docker ps
+    - shell: systemctl restart traefik
+"""
+
+_DIRTY_COMPOSE = b"""\
+services:
+  traefik:
+    image: traefik:v3.2
+    volumes:
+      - /var/run/docker.sock:/var/run/docker.sock
+    privileged: true
+  traefik-oauth2-proxy:
+    image: quay.io/oauth2-proxy/oauth2-proxy:v7.6.0
+    network_mode: host
+networks:
+  traefik:
+  socket-proxy:
+"""
+
+_CLEAN_PLAYBOOK = b"""\
+- name: Deploy Traefik stack
+  hosts: traefik
+  tasks:
+    - name: Ensure Traefik compose is present
+      community.docker.docker_compose:
+        project_src: /opt/stacks/traefik
+        state: present
+"""
+
+_CLEAN_COMPOSE = b"""\
+services:
+  traefik:
+    image: traefik:v3.2
+    networks:
+      - traefik
+      - socket-proxy
+networks:
+  traefik:
+  socket-proxy:
+"""
+
+
+def _link_or_copy(canonical: Path, target: Path) -> None:
+    """Symlink target to canonical, copying where symlinks are unavailable."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.symlink(canonical, target)
+    except OSError:
+        shutil.copyfile(canonical, target)
 
 
 def _create_project(tmp_path: Path, *, with_issues: bool) -> Path:
-    playbook_path = tmp_path / "playbooks" / "site.yml"
-    compose_path = tmp_path / "stacks" / "app" / "docker-compose.yml"
-
     if with_issues:
-        playbook_lines = [
-            "- name: Deploy Traefik stack",
-            "  hosts: traefik",
-            "  tasks:",
-            "    - name: Pull Traefik image",
-            "      community.docker.docker_image:",
-            "        name: traefik:v3.2",
-            "    - name: Insecure Docker access",
-            "      shell: docker ps",
-            "    - shell: systemctl restart traefik",
-        ]
-        compose_lines = [
-            "services:",
-            "  traefik:",
-            "    image: traefik:v3.2",
-            "    volumes:",
-            "      - /var/run/docker.sock:/var/run/docker.sock",
-            "    privileged: true",
-            "  traefik-oauth2-proxy:",
-            "    image: quay.io/oauth2-proxy/oauth2-proxy:v7.6.0",
-            "    network_mode: host",
-            "networks:",
-            "  traefik:",
-            "  socket-proxy:",
-            "networks:",
-            "  traefik:",
-            "  socket-proxy:",
-        ]
+        playbook_blob, compose_blob = _DIRTY_PLAYBOOK, _DIRTY_COMPOSE
     else:
-        playbook_lines = [
-            "- name: Deploy Traefik stack",
-            "  hosts: traefik",
-            "  tasks:",
-            "    - name: Ensure Traefik compose is present",
-            "      community.docker.docker_compose:",
-            "        project_src: /opt/stacks/traefik",
-            "        state: present",
-        ]
-        compose_lines = [
-            "services:",
-            "  traefik:",
-            "    image: traefik:v3.2",
-            "    networks:",
-            "      - traefik",
-            "      - socket-proxy",
-            "networks:",
-            "  traefik:",
-            "  socket-proxy:",
-        ]
-
-    _write_yaml(playbook_path, playbook_lines)
-    _write_yaml(compose_path, compose_lines)
+        playbook_blob, compose_blob = _CLEAN_PLAYBOOK, _CLEAN_COMPOSE
 
+    files = {
+        "playbooks/site.yml": playbook_blob,
+        "stacks/app/docker-compose.yml": compose_blob,
+    }
     if with_issues:
-        # Duplicate problem files to increase issue count and mimic multiple stacks
-        for idx in range(1, 5):
-            _write_yaml(tmp_path / "playbooks" / f"traefik_bad_{idx}.yml", playbook_lines)
-        for idx in range(1, 5):
-            extra_compose = tmp_path / "stacks" / f"traefik_bad_{idx}" / "docker-compose.yml"
-            _write_yaml(extra_compose, compose_lines)
+        # Write one canonical copy of each problem file and symlink the rest;
+        # the analyzer still sees 10 distinct paths but the bytes live once
+        files["playbooks/traefik_bad_1.yml"] = playbook_blob
+        files["stacks/traefik_bad_1/docker-compose.yml"] = compose_blob
+
+    _bulk_write(tmp_path, files)
 
+    if with_issues:
+        for idx in range(2, 5):
+            _link_or_copy(tmp_path / "playbooks/traefik_bad_1.yml", tmp_path / f"playbooks/traefik_bad_{idx}.yml")
+            _link_or_copy(
+                tmp_path / "stacks/traefik_bad_1/docker-compose.yml",
+                tmp_path / f"stacks/traefik_bad_{idx}/docker-compose.yml",
+            )
     return tmp_path
 
 
+@pytest.fixture(scope="module")
+def clean_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Project without quality issues, materialized once for the module."""
+    return _create_project(tmp_path_factory.mktemp("clean_project"), with_issues=False)
+
+
+@pytest.fixture(scope="module")
+def dirty_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Project full of quality issues, materialized once for the module."""
+    return _create_project(tmp_path_factory.mktemp("dirty_project"), with_issues=True)
+
+
 def _run_cli(args: list[str]) -> int:
-    original = sys.argv
-    try:
-        sys.argv = ["analyze_iac.py", *args]
-        return analyze_iac.main()
-    finally:
-        sys.argv = original
+    # main accepts argv directly; no need to mutate the sys.argv global
+    return analyze_iac.main(args)
 
 
-def test_cli_generates_json_report(tmp_path: Path) -> None:
-    project = _create_project(tmp_path, with_issues=False)
+def test_cli_generates_json_report(clean_project: Path, tmp_path: Path) -> None:
     output = tmp_path / "report.json"
 
-    exit_code = _run_cli(["--root", str(project), "--output", str(output), "--format", "json"])
+    exit_code = _run_cli(["--root", str(clean_project), "--output", str(output), "--format", "json"])
 
     assert exit_code == 0
     data = json.loads(output.read_text(encoding="utf-8"))
@@ -110,20 +140,18 @@ def test_cli_generates_json_report(tmp_path: Path) -> None:
     assert data["summary"]["total_issues"] == 0
 
 
-def test_cli_text_output(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
-    project = _create_project(tmp_path, with_issues=False)
-    exit_code = _run_cli(["--root", str(project), "--format", "text"])
+def test_cli_text_output(clean_project: Path, capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+    exit_code = _run_cli(["--root", str(clean_project), "--format", "text"])
 
-    captured = capsys.readouterr()
+    captured = capsysbinary.readouterr()
     assert exit_code == 0
-    assert "Infrastructure-as-Code Quality Report" in captured.out
+    assert b"Infrastructure-as-Code Quality Report" in captured.out
 
 
-def test_cli_failure_on_low_score(tmp_path: Path) -> None:
-    project = _create_project(tmp_path, with_issues=True)
+def test_cli_failure_on_low_score(dirty_project: Path, tmp_path: Path) -> None:
     output = tmp_path / "report.json"
 
-    exit_code = _run_cli(["--root", str(project), "--output", str(output)])
+    exit_code = _run_cli(["--root", str(dirty_project), "--output", str(output)])
 
     assert exit_code == 1
     data = json.loads(output.read_text(encoding="utf-8"))
@@ -1,32 +1,29 @@
 """Unit tests for bootstrap and health check playbooks."""
 
-from pathlib import Path
+import re
 
 import pytest
-import yaml
 
 
 pytestmark = pytest.mark.unit
 
 
-@pytest.fixture
-def playbooks_dir():
-    """Get the playbooks directory."""
-    return Path(__file__).parent.parent / "playbooks"
+@pytest.fixture(scope="session")
+def compose_cache(yaml_documents):
+    """Look up pre-parsed compose files by path relative to stacks/."""
+    return lambda relpath: yaml_documents[f"stacks/{relpath}"]
 
 
-@pytest.fixture
-def bootstrap_playbook(playbooks_dir):
+@pytest.fixture(scope="session")
+def bootstrap_playbook(yaml_documents):
     """Load the bootstrap playbook."""
-    with open(playbooks_dir / "docker-bootstrap.yml") as f:
-        return yaml.safe_load(f)
+    return yaml_documents["playbooks/docker-bootstrap.yml"]
 
 
-@pytest.fixture
-def health_check_playbook(playbooks_dir):
+@pytest.fixture(scope="session")
+def health_check_playbook(yaml_documents):
     """Load the health check playbook."""
-    with open(playbooks_dir / "docker-check-health.yml") as f:
-        return yaml.safe_load(f)
+    return yaml_documents["playbooks/docker-check-health.yml"]
 
 
 class TestBootstrapPlaybook:
@@ -107,11 +104,6 @@ class TestHealthCheckPlaybook:
 class TestNetworkDefinitions:
     """Test network definitions in compose files."""
 
-    @pytest.fixture
-    def stacks_dir(self):
-        """Get the stacks directory."""
-        return Path(__file__).parent.parent / "stacks"
-
     @pytest.mark.parametrize(
         "compose_file, service_name",
         [
@@ -120,10 +112,9 @@ class TestNetworkDefinitions:
             ("dockge/docker-compose.yml", "dockge"),
         ],
     )
-    def test_service_defines_networks(self, stacks_dir, compose_file, service_name):
+    def test_service_defines_networks(self, compose_cache, compose_file, service_name):
         """Verify each key service joins at least one Docker network."""
-        with open(stacks_dir / compose_file) as f:
-            content = yaml.safe_load(f)
+        content = compose_cache(compose_file)
 
         services = content.get("services", {})
         assert service_name in services, f"{compose_file} missing {service_name} service"
@@ -132,56 +123,53 @@ class TestNetworkDefinitions:
         networks = service.get("networks", [])
         assert networks, f"{compose_file} service {service_name} missing networks"
 
-    def test_traefik_networks(self, stacks_dir):
-        """Verify traefik service references expected networks."""
-        with open(stacks_dir / "traefik/docker-compose.yml") as f:
-            content = yaml.safe_load(f)
-
-        service = content["services"]["traefik"]
-        networks = service.get("networks", [])
-        assert "traefik" in networks, "Traefik service missing traefik network"
-        assert "socket-proxy" in networks, "Traefik service missing socket-proxy network"
-
-    def test_socket_proxy_networks(self, stacks_dir):
-        """Verify docker-socket-proxy service references expected networks."""
-        with open(stacks_dir / "docker-socket-proxy/docker-compose.yml") as f:
-            content = yaml.safe_load(f)
+    @pytest.mark.parametrize(
+        "compose_file, service_name, expected_networks",
+        [
+            ("traefik/docker-compose.yml", "traefik", {"traefik", "socket-proxy"}),
+            ("docker-socket-proxy/docker-compose.yml", "docker-socket-proxy", {"socket-proxy"}),
+            ("dockge/docker-compose.yml", "dockge", {"socket-proxy", "traefik"}),
+        ],
+    )
+    def test_service_network_membership(self, compose_cache, compose_file, service_name, expected_networks):
+        """Verify each key service joins its expected networks."""
+        content = compose_cache(compose_file)
 
-        service = content["services"]["docker-socket-proxy"]
-        networks = service.get("networks", [])
-        assert "socket-proxy" in networks, "docker-socket-proxy service missing socket-proxy network"
+        service = content["services"][service_name]
+        networks = set(service.get("networks", []))
+        missing = expected_networks - networks
+        assert not missing, f"{service_name} service missing networks: {sorted(missing)}"
 
-    def test_dockge_networks(self, stacks_dir):
-        """Verify dockge service references expected networks."""
-        with open(stacks_dir / "dockge/docker-compose.yml") as f:
-            content = yaml.safe_load(f)
 
-        service = content["services"]["dockge"]
-        networks = service.get("networks", [])
-        assert "socket-proxy" in networks, "dockge service missing socket-proxy network"
-        assert "traefik" in networks, "dockge service missing traefik network"
+# All Makefile substrings the tests assert on, found in a single scan.
+# Longer alternatives come first so "health" doesn't shadow the others.
+_MAKEFILE_TOKEN_RE = re.compile(
+    r"docker-bootstrap\.yml|docker-bootstrap:|docker-check-health\.yml"
+    r"|docker-health:|Bootstrap infrastructure|health"
+)
 
 
 class TestMakefileTargets:
     """Test Makefile has new targets."""
 
-    @pytest.fixture
-    def makefile(self):
-        """Load the Makefile."""
-        with open(Path(__file__).parent.parent / "Makefile") as f:
-            return f.read()
+    @pytest.fixture(scope="session")
+    def makefile_tokens(self, makefile_text):
+        """Collect all expected Makefile tokens in one pass over the file."""
+        return frozenset(_MAKEFILE_TOKEN_RE.findall(makefile_text))
 
-    def test_docker_bootstrap_target(self, makefile):
+    def test_docker_bootstrap_target(self, makefile_tokens):
         """Verify docker-bootstrap target exists."""
-        assert "docker-bootstrap:" in makefile, "Missing docker-bootstrap target"
-        assert "docker-bootstrap.yml" in makefile, "Target doesn't reference bootstrap playbook"
+        assert "docker-bootstrap:" in makefile_tokens, "Missing docker-bootstrap target"
+        assert "docker-bootstrap.yml" in makefile_tokens, "Target doesn't reference bootstrap playbook"
 
-    def test_docker_health_target(self, makefile):
+    def test_docker_health_target(self, makefile_tokens):
         """Verify docker-health target exists."""
-        assert "docker-health:" in makefile, "Missing docker-health target"
-        assert "docker-check-health.yml" in makefile, "docker-health target doesn't reference health check playbook"
+        assert "docker-health:" in makefile_tokens, "Missing docker-health target"
+        assert "docker-check-health.yml" in makefile_tokens, (
+            "docker-health target doesn't reference health check playbook"
+        )
 
-    def test_help_messages(self, makefile):
+    def test_help_messages(self, makefile_tokens):
         """Verify help messages are documented."""
-        assert "Bootstrap infrastructure" in makefile, "Missing bootstrap help message"
-        assert "health" in makefile, "Missing health check help message"
+        assert "Bootstrap infrastructure" in makefile_tokens, "Missing bootstrap help message"
+        assert "health" in makefile_tokens, "Missing health check help message"